@@ -16,7 +16,7 @@ from langflow.api.utils import cascade_delete_flow, remove_api_keys, validate_is
 from langflow.api.v1.schemas import FlowListCreate
 from langflow.initial_setup.setup import STARTER_FOLDER_NAME
 from langflow.services.auth.utils import get_current_active_user
-from langflow.services.database.models.flow import Flow, FlowCreate, FlowRead, FlowUpdate
+from langflow.services.database.models.flow import Flow, FlowCreate, FlowListRead, FlowRead, FlowUpdate
 from langflow.services.database.models.flow.utils import get_webhook_component_in_flow
 from langflow.services.database.models.folder.constants import DEFAULT_FOLDER_NAME
 from langflow.services.database.models.folder.model import Folder
@@ -179,6 +179,63 @@ def read_flows(
     return [jsonable_encoder(flow) for flow in flows]
 
 
+@router.get("/headers", response_model=list[FlowListRead], status_code=200)
+def read_flow_headers(
+    *,
+    current_user: User = Depends(get_current_active_user),
+    session: Session = Depends(get_session),
+    settings_service: "SettingsService" = Depends(get_settings_service),
+    remove_example_flows: bool = False,
+    components_only: bool = False,
+):
+    """
+    Retrieve the same list of flows as `read_flows`, without their data.
+
+    Unlike `read_flows`, `is_component` is returned as stored: flows where it is
+    still unset are not classified from their data, since the data is never loaded.
+
+    Args:
+        current_user (User): The current authenticated user.
+        session (Session): The database session.
+        settings_service (SettingsService): The settings service.
+        remove_example_flows (bool, optional): Whether to remove example flows. Defaults to False.
+        components_only (bool, optional): Whether to return only components. Defaults to False.
+
+    Returns:
+        List[FlowListRead]: The listing fields of each flow.
+    """
+    try:
+        if settings_service.auth_settings.AUTO_LOGIN:
+            user_filter = (Flow.user_id == None) | (Flow.user_id == current_user.id)  # noqa
+        else:
+            user_filter = Flow.user_id == current_user.id
+        folder = session.exec(select(Folder).where(Folder.name == STARTER_FOLDER_NAME)).first()
+
+        stmt = select(
+            Flow.id,
+            Flow.name,
+            Flow.description,
+            Flow.icon,
+            Flow.icon_bg_color,
+            Flow.is_component,
+            Flow.updated_at,
+            Flow.endpoint_name,
+            Flow.folder_id,
+        )
+        if components_only:
+            stmt = stmt.where(user_filter, Flow.is_component == True)  # noqa
+        elif not remove_example_flows and folder:
+            # include the starter projects along with the user's flows
+            stmt = stmt.where(user_filter | (Flow.folder_id == folder.id))
+        else:
+            stmt = stmt.where(user_filter)
+        if remove_example_flows and folder:
+            stmt = stmt.where((Flow.folder_id == None) | (Flow.folder_id != folder.id))  # noqa
+        return session.exec(stmt).all()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
 @router.get("/{flow_id}", response_model=FlowRead, status_code=200)
 def read_flow(
     *,
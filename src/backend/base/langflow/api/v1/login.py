@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlmodel import Session
@@ -29,7 +31,8 @@ async def login_to_get_access_token(
 ):
     auth_settings = settings_service.auth_settings
     try:
-        user = authenticate_user(form_data.username, form_data.password, db)
+        # The auth, token and variable helpers are synchronous; run their DB work off the event loop
+        user = await asyncio.to_thread(authenticate_user, form_data.username, form_data.password, db)
     except Exception as exc:
         if isinstance(exc, HTTPException):
             raise exc
@@ -39,7 +42,7 @@ async def login_to_get_access_token(
         ) from exc
 
     if user:
-        tokens = create_user_tokens(user_id=user.id, db=db, update_last_login=True)
+        tokens = await asyncio.to_thread(create_user_tokens, user_id=user.id, db=db, update_last_login=True)
         response.set_cookie(
             "refresh_token_lf",
             tokens["refresh_token"],
@@ -67,9 +70,9 @@ async def login_to_get_access_token(
             expires=None,  # Set to None to make it a session cookie
             domain=auth_settings.COOKIE_DOMAIN,
         )
-        variable_service.initialize_user_variables(user.id, db)
+        await asyncio.to_thread(variable_service.initialize_user_variables, user.id, db)
         # Create default folder for user if it doesn't exist
-        create_default_folder_if_it_doesnt_exist(db, user.id)
+        await asyncio.to_thread(create_default_folder_if_it_doesnt_exist, db, user.id)
         return tokens
     else:
         raise HTTPException(
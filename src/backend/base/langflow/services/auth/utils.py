@@ -3,6 +3,7 @@ import random
 import warnings
 from collections.abc import Coroutine
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Annotated
 from uuid import UUID
 
@@ -360,11 +361,16 @@ def ensure_valid_key(s: str) -> bytes:
     return key
 
 
+@lru_cache(maxsize=8)
+def _get_fernet_for_key(secret_key: str) -> Fernet:
+    # Deriving the key is far more expensive than a single encrypt/decrypt, so reuse it per secret key
+    valid_key = ensure_valid_key(secret_key)
+    return Fernet(valid_key)
+
+
 def get_fernet(settings_service=Depends(get_settings_service)):
     SECRET_KEY: str = settings_service.auth_settings.SECRET_KEY.get_secret_value()
-    valid_key = ensure_valid_key(SECRET_KEY)
-    fernet = Fernet(valid_key)
-    return fernet
+    return _get_fernet_for_key(SECRET_KEY)
 
 
 def encrypt_api_key(api_key: str, settings_service=Depends(get_settings_service)):
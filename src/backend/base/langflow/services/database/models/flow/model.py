@@ -1,8 +1,9 @@
 # Path: src/backend/langflow/services/database/models/flow/model.py
 
+import functools
 import re
-import warnings
 from datetime import datetime, timezone
+from itertools import chain
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
@@ -11,7 +12,7 @@ from emoji import purely_emoji  # type: ignore
 from fastapi import HTTPException, status
 from pydantic import field_serializer, field_validator
 from sqlalchemy import Text, UniqueConstraint
-from sqlmodel import JSON, Column, Field, Relationship, SQLModel
+from sqlmodel import JSON, Column, DateTime, Field, Relationship, SQLModel, func
 
 from langflow.schema import Data
 from langflow.services.database.models.vertex_builds.model import VertexBuildTable
@@ -22,6 +23,47 @@ if TYPE_CHECKING:
     from langflow.services.database.models.message import MessageTable
     from langflow.services.database.models.user import User
 
+_ENDPOINT_NAME_RE = re.compile(r"[A-Za-z0-9_-]+\Z")
+_ICON_NAME_RE = re.compile(r"[A-Za-z][A-Za-z0-9_-]*\Z")
+_HEX_COLOR_RE = re.compile(r"#[0-9A-Fa-f]{6}\Z")
+
+# Code points that can appear in an emoji sequence: pictographs, symbols, regional indicators,
+# general punctuation (ZWJ, keycap combiner), variation selectors and tag characters.
+# This is a superset used to cheaply reject strings before asking the emoji library.
+_EMOJI_CODEPOINTS = frozenset(
+    chain(
+        range(0x1F000, 0x1FB00),
+        range(0x2000, 0x2C00),
+        range(0xE0020, 0xE0080),
+        (0x00A9, 0x00AE, 0x3030, 0x303D, 0x3297, 0x3299, 0xFE0F),
+        map(ord, "#*0123456789"),
+    )
+)
+
+
+# Icons come from a small closed set, so repeated validations are served from the cache
+_purely_emoji_cached = functools.lru_cache(maxsize=1024)(purely_emoji)
+
+
+def _is_emoji_sequence(value: str) -> bool:
+    return bool(value) and all(ord(char) in _EMOJI_CODEPOINTS for char in value)
+
+
+def _validate_endpoint_name(v):
+    # Endpoint name must be a string containing only letters, numbers, hyphens, and underscores
+    if v is not None:
+        if not isinstance(v, str):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Endpoint name must be a string",
+            )
+        if not _ENDPOINT_NAME_RE.match(v):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Endpoint name must contain only letters, numbers, hyphens, and underscores",
+            )
+    return v
+
 
 class FlowBase(SQLModel):
     name: str = Field(index=True)
@@ -30,40 +72,20 @@ class FlowBase(SQLModel):
     icon_bg_color: str | None = Field(default=None, nullable=True)
     data: dict | None = Field(default=None, nullable=True)
     is_component: bool | None = Field(default=False, nullable=True)
-    updated_at: datetime | None = Field(default_factory=lambda: datetime.now(timezone.utc), nullable=True)
+    updated_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=True),
+    )
     webhook: bool | None = Field(default=False, nullable=True, description="Can be used on the webhook endpoint")
     endpoint_name: str | None = Field(default=None, nullable=True, index=True)
 
-    @field_validator("endpoint_name")
-    @classmethod
-    def validate_endpoint_name(cls, v):
-        # Endpoint name must be a string containing only letters, numbers, hyphens, and underscores
-        if v is not None:
-            if not isinstance(v, str):
-                raise HTTPException(
-                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                    detail="Endpoint name must be a string",
-                )
-            if not re.match(r"^[a-zA-Z0-9_-]+$", v):
-                raise HTTPException(
-                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                    detail="Endpoint name must contain only letters, numbers, hyphens, and underscores",
-                )
-        return v
+    validate_endpoint_name = field_validator("endpoint_name")(_validate_endpoint_name)
 
     @field_validator("icon_bg_color")
     def validate_icon_bg_color(cls, v):
-        if v is not None and not isinstance(v, str):
-            msg = "Icon background color must be a string"
-            raise ValueError(msg)
-        # validate that is is a hex color
-        if v and not v.startswith("#"):
-            msg = "Icon background color must start with #"
-            raise ValueError(msg)
-
-        # validate that it is a valid hex color
-        if v and len(v) != 7:
-            msg = "Icon background color must be 7 characters long"
+        # the full hex check runs on create only, so flows stored with older values can still be read
+        if v and (not v.startswith("#") or len(v) != 7):
+            msg = "Icon background color must be a hex color in the #RRGGBB format"
             raise ValueError(msg)
         return v
 
@@ -72,39 +94,24 @@ class FlowBase(SQLModel):
         #   const emojiRegex = /\p{Emoji}/u;
         # const isEmoji = emojiRegex.test(data?.node?.icon!);
         # emoji pattern in Python
-        if v is None:
+        if not v:
             return v
         # we are going to use the emoji library to validate the emoji
         # emojis can be defined using the :emoji_name: syntax
-
-        if not v.startswith(":") and not v.endswith(":"):
-            return v
-        elif not v.startswith(":") or not v.endswith(":"):
+        if v.startswith(":") and v.endswith(":"):
+            emoji_value = emoji.emojize(v, variant="emoji_type")
+            # emojize returns the input unchanged when it does not know the shortcode
+            if emoji_value != v and _is_emoji_sequence(emoji_value) and _purely_emoji_cached(emoji_value):
+                return emoji_value
+            msg = f"Invalid emoji. {v} is not a valid emoji."
+            raise ValueError(msg)
+        if v.startswith(":") or v.endswith(":"):
             # emoji should have both starting and ending colons
             # so if one of them is missing, we will raise
             msg = f"Invalid emoji. {v} is not a valid emoji."
             raise ValueError(msg)
-
-        emoji_value = emoji.emojize(v, variant="emoji_type")
-        if v == emoji_value:
-            warnings.warn(f"Invalid emoji. {v} is not a valid emoji.")
-            icon = v
-        icon = emoji_value
-
-        if purely_emoji(icon):
-            # this is indeed an emoji
-            return icon
-        # otherwise it should be a valid lucide icon
-        if v is not None and not isinstance(v, str):
-            msg = "Icon must be a string"
-            raise ValueError(msg)
-        # is should be lowercase and contain only letters and hyphens
-        if v and not v.islower():
-            msg = "Icon must be lowercase"
-            raise ValueError(msg)
-        if v and not v.replace("-", "").isalpha():
-            msg = "Icon must contain only letters and hyphens"
-            raise ValueError(msg)
+        # plain strings (lucide names, raw emojis) are checked on create only,
+        # so flows stored with older icon values can still be read
         return v
 
     @field_validator("data")
@@ -131,9 +138,9 @@ class FlowBase(SQLModel):
         if isinstance(value, datetime):
             # I'm getting 2024-05-29T17:57:17.631346
             # and I want 2024-05-29T17:57:17-05:00
-            value = value.replace(microsecond=0)
-            if value.tzinfo is None:
-                value = value.replace(tzinfo=timezone.utc)
+            # a single replace (or none) instead of one per adjusted attribute
+            if value.microsecond or value.tzinfo is None:
+                value = value.replace(microsecond=0, tzinfo=value.tzinfo or timezone.utc)
             return value.isoformat()
         return value
 
@@ -159,15 +166,17 @@ class Flow(FlowBase, table=True):  # type: ignore
     vertex_builds: list["VertexBuildTable"] = Relationship(back_populates="flow")
 
     def to_data(self):
-        serialized = self.model_dump()
+        # Read the fields directly instead of dumping the whole model (including the potentially
+        # large `data` tree) only to keep five of them.
         data = {
-            "id": serialized.pop("id"),
-            "data": serialized.pop("data"),
-            "name": serialized.pop("name"),
-            "description": serialized.pop("description"),
-            "updated_at": serialized.pop("updated_at"),
+            "id": self.id,
+            "data": self.data,
+            "name": self.name,
+            "description": self.description,
+            "updated_at": FlowBase.serialize_datetime(self.updated_at),
         }
-        record = Data(data=data)
+        # The fields come from an already validated Flow, so skip re-validating them
+        record = Data.model_construct(data=data)
         return record
 
     __table_args__ = (
@@ -180,6 +189,26 @@ class FlowCreate(FlowBase):
     user_id: UUID | None = None
     folder_id: UUID | None = None
 
+    @field_validator("icon")
+    def validate_icon_name(cls, v):
+        if not v:
+            return v
+        # an icon name (e.g. "Bot", "bar-chart-2", "custom_components") starts with a letter
+        if _ICON_NAME_RE.match(v):
+            return v
+        # otherwise it should be a raw emoji
+        if _is_emoji_sequence(v) and _purely_emoji_cached(v):
+            return v
+        msg = "Icon must be an emoji or a name containing only letters, digits, hyphens and underscores"
+        raise ValueError(msg)
+
+    @field_validator("icon_bg_color")
+    def validate_icon_bg_color_hex(cls, v):
+        if v and not _HEX_COLOR_RE.match(v):
+            msg = "Icon background color must be a hex color in the #RRGGBB format"
+            raise ValueError(msg)
+        return v
+
 
 class FlowRead(FlowBase):
     id: UUID
@@ -187,6 +216,21 @@ class FlowRead(FlowBase):
     folder_id: UUID | None = Field()
 
 
+class FlowListRead(SQLModel):
+    # Lean projection for listings: leaves out the (potentially large) `data` column
+    id: UUID
+    name: str
+    description: str | None = None
+    icon: str | None = None
+    icon_bg_color: str | None = None
+    is_component: bool | None = None
+    updated_at: datetime | None = None
+    endpoint_name: str | None = None
+    folder_id: UUID | None = None
+
+    serialize_datetime = field_serializer("updated_at")(FlowBase.serialize_datetime)
+
+
 class FlowUpdate(SQLModel):
     name: str | None = None
     description: str | None = None
@@ -194,19 +238,4 @@ class FlowUpdate(SQLModel):
     folder_id: UUID | None = None
     endpoint_name: str | None = None
 
-    @field_validator("endpoint_name")
-    @classmethod
-    def validate_endpoint_name(cls, v):
-        # Endpoint name must be a string containing only letters, numbers, hyphens, and underscores
-        if v is not None:
-            if not isinstance(v, str):
-                raise HTTPException(
-                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                    detail="Endpoint name must be a string",
-                )
-            if not re.match(r"^[a-zA-Z0-9_-]+$", v):
-                raise HTTPException(
-                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                    detail="Endpoint name must contain only letters, numbers, hyphens, and underscores",
-                )
-        return v
+    validate_endpoint_name = field_validator("endpoint_name")(_validate_endpoint_name)
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
 from pydantic import ValidationInfo, field_validator
+from sqlalchemy import Index
 from sqlmodel import JSON, Column, DateTime, Field, Relationship, SQLModel, func
 
 from langflow.services.variable.constants import CREDENTIAL_TYPE
@@ -44,6 +45,8 @@ class Variable(VariableBase, table=True):  # type: ignore
     user_id: UUID = Field(description="User ID associated with this variable", foreign_key="user.id")
     user: "User" = Relationship(back_populates="variables")
 
+    __table_args__ = (Index("ix_variable_user_id_name", "user_id", "name"),)
+
 
 class VariableCreate(VariableBase):
     created_at: datetime | None = Field(default_factory=utc_now, description="Creation time of the variable")
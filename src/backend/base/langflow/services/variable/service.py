@@ -3,16 +3,15 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from fastapi import Depends
 from loguru import logger
+from sqlalchemy.exc import NoResultFound
 from sqlmodel import Session, select
 
 from langflow.services.auth import utils as auth_utils
 from langflow.services.base import Service
 from langflow.services.database.models.variable.model import Variable, VariableCreate, VariableUpdate
-from langflow.services.deps import get_session
 from langflow.services.variable.base import VariableService
-from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
+from langflow.services.variable.constants import CREDENTIAL_TYPE
 
 if TYPE_CHECKING:
     from langflow.services.settings.service import SettingsService
@@ -22,45 +21,49 @@ class DatabaseVariableService(VariableService, Service):
     def __init__(self, settings_service: "SettingsService"):
         self.settings_service = settings_service
 
-    def initialize_user_variables(self, user_id: UUID | str, session: Session = Depends(get_session)):
+    def initialize_user_variables(self, user_id: UUID | str, session: Session):
         # Check for environment variables that should be stored in the database
         should_or_should_not = "Should" if self.settings_service.settings.store_environment_variables else "Should not"
         logger.info(f"{should_or_should_not} store environment variables in the database.")
         if self.settings_service.settings.store_environment_variables:
-            for var in self.settings_service.settings.variables_to_get_from_environment:
-                if var in os.environ:
-                    logger.debug(f"Creating {var} variable from environment.")
-
-                    if found_variable := session.exec(
-                        select(Variable).where(Variable.user_id == user_id, Variable.name == var)
-                    ).first():
+            wanted_values = {
+                var: os.environ[var].strip()
+                for var in self.settings_service.settings.variables_to_get_from_environment
+                if var in os.environ
+            }
+            if not wanted_values:
+                return
+            existing = self.get_variables(user_id=user_id, names=list(wanted_values), session=session)
+            variables: list[Variable] = []
+            for var, value in wanted_values.items():
+                logger.debug(f"Creating {var} variable from environment.")
+                try:
+                    # If the secret_key changes the stored value could be invalid
+                    # so we need to re-encrypt it
+                    encrypted = auth_utils.encrypt_api_key(value, settings_service=self.settings_service)
+                    if found_variable := existing.get(var):
                         # Update it
-                        value = os.environ[var]
-                        if isinstance(value, str):
-                            value = value.strip()
-                        # If the secret_key changes the stored value could be invalid
-                        # so we need to re-encrypt it
-                        encrypted = auth_utils.encrypt_api_key(value, settings_service=self.settings_service)
                         found_variable.value = encrypted
-                        session.add(found_variable)
-                        session.commit()
+                        variables.append(found_variable)
                     else:
                         # Create it
-                        try:
-                            value = os.environ[var]
-                            if isinstance(value, str):
-                                value = value.strip()
-                            self.create_variable(
+                        variables.append(
+                            self._build_variable(
                                 user_id=user_id,
                                 name=var,
-                                value=value,
+                                encrypted_value=encrypted,
                                 default_fields=[],
                                 _type=CREDENTIAL_TYPE,
-                                session=session,
                             )
-                        except Exception as e:
-                            logger.error(f"Error creating {var} variable: {e}")
-
+                        )
+                except Exception as e:
+                    logger.error(f"Error creating {var} variable: {e}")
+            try:
+                session.add_all(variables)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Error storing environment variables: {e}")
         else:
             logger.info("Skipping environment variable storage.")
 
@@ -69,11 +72,10 @@ class DatabaseVariableService(VariableService, Service):
         user_id: UUID | str,
         name: str,
         field: str,
-        session: Session = Depends(get_session),
+        session: Session,
     ) -> str:
         # we get the credential from the database
-        # credential = session.query(Variable).filter(Variable.user_id == user_id, Variable.name == name).first()
-        variable = session.exec(select(Variable).where(Variable.user_id == user_id, Variable.name == name)).first()
+        variable = self.get_variables(user_id=user_id, names=[name], session=session).get(name)
 
         if not variable or not variable.value:
             msg = f"{name} variable not found."
@@ -90,19 +92,29 @@ class DatabaseVariableService(VariableService, Service):
         decrypted = auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
         return decrypted
 
-    def get_all(self, user_id: UUID | str, session: Session = Depends(get_session)) -> list[Variable | None]:
+    def get_variables(
+        self,
+        user_id: UUID | str,
+        names: list[str],
+        session: Session,
+    ) -> dict[str, Variable]:
+        if not names:
+            return {}
+        stmt = select(Variable).where(Variable.user_id == user_id, Variable.name.in_(names))  # type: ignore
+        return {variable.name: variable for variable in session.exec(stmt).all()}
+
+    def get_all(self, user_id: UUID | str, session: Session) -> list[Variable | None]:
         return list(session.exec(select(Variable).where(Variable.user_id == user_id)).all())
 
-    def list_variables(self, user_id: UUID | str, session: Session = Depends(get_session)) -> list[str | None]:
-        variables = self.get_all(user_id=user_id, session=session)
-        return [variable.name for variable in variables if variable]
+    def list_variables(self, user_id: UUID | str, session: Session) -> list[str | None]:
+        return list(session.exec(select(Variable.name).where(Variable.user_id == user_id)).all())
 
     def update_variable(
         self,
         user_id: UUID | str,
         name: str,
         value: str,
-        session: Session = Depends(get_session),
+        session: Session,
     ):
         variable = session.exec(select(Variable).where(Variable.user_id == user_id, Variable.name == name)).first()
         if not variable:
@@ -120,17 +132,22 @@ class DatabaseVariableService(VariableService, Service):
         user_id: UUID | str,
         variable_id: UUID | str,
         variable: VariableUpdate,
-        session: Session = Depends(get_session),
+        session: Session,
     ):
-        query = select(Variable).where(Variable.id == variable_id, Variable.user_id == user_id)
-        db_variable = session.exec(query).one()
+        db_variable = session.get(Variable, variable_id)
+        if not db_variable or str(db_variable.user_id) != str(user_id):
+            msg = f"{variable_id} variable not found."
+            raise NoResultFound(msg)
 
         variable_data = variable.model_dump(exclude_unset=True)
         for key, value in variable_data.items():
             setattr(db_variable, key, value)
+        # Only a new plaintext value needs encrypting; the stored one is already encrypted
+        if "value" in variable_data:
+            db_variable.value = auth_utils.encrypt_api_key(
+                variable_data["value"], settings_service=self.settings_service
+            )
         db_variable.updated_at = datetime.now(timezone.utc)
-        encrypted = auth_utils.encrypt_api_key(db_variable.value, settings_service=self.settings_service)
-        variable.value = encrypted
 
         session.add(db_variable)
         session.commit()
@@ -141,7 +158,7 @@ class DatabaseVariableService(VariableService, Service):
         self,
         user_id: UUID | str,
         name: str,
-        session: Session = Depends(get_session),
+        session: Session,
     ):
         stmt = select(Variable).where(Variable.user_id == user_id).where(Variable.name == name)
         variable = session.exec(stmt).first()
@@ -152,8 +169,8 @@ class DatabaseVariableService(VariableService, Service):
         session.commit()
 
     def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: Session):
-        variable = session.exec(select(Variable).where(Variable.user_id == user_id, Variable.id == variable_id)).first()
-        if not variable:
+        variable = session.get(Variable, variable_id)
+        if not variable or str(variable.user_id) != str(user_id):
             msg = f"{variable_id} variable not found."
             raise ValueError(msg)
         session.delete(variable)
@@ -164,18 +181,35 @@ class DatabaseVariableService(VariableService, Service):
         user_id: UUID | str,
         name: str,
         value: str,
-        default_fields: list[str] = [],
-        _type: str = GENERIC_TYPE,
-        session: Session = Depends(get_session),
+        default_fields: list[str],
+        _type: str,
+        session: Session,
     ):
-        variable_base = VariableCreate(
+        variable = self._build_variable(
+            user_id=user_id,
             name=name,
-            type=_type,
-            value=auth_utils.encrypt_api_key(value, settings_service=self.settings_service),
+            encrypted_value=auth_utils.encrypt_api_key(value, settings_service=self.settings_service),
             default_fields=default_fields,
+            _type=_type,
         )
-        variable = Variable.model_validate(variable_base, from_attributes=True, update={"user_id": user_id})
         session.add(variable)
         session.commit()
         session.refresh(variable)
         return variable
+
+    @staticmethod
+    def _build_variable(
+        user_id: UUID | str,
+        name: str,
+        encrypted_value: str,
+        default_fields: list[str],
+        _type: str,
+    ) -> Variable:
+        # Builds the row without adding it to a session, so callers can batch the commit
+        variable_base = VariableCreate(
+            name=name,
+            type=_type,
+            value=encrypted_value,
+            default_fields=default_fields,
+        )
+        return Variable.model_validate(variable_base, from_attributes=True, update={"user_id": user_id})
@@ -3,6 +3,7 @@ from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.exc import NoResultFound
 from sqlmodel import Session, SQLModel, create_engine
 
 from langflow.services.database.models.variable.model import VariableUpdate
@@ -36,7 +37,9 @@ def test_initialize_user_variables__donkey(service, session):
     name = "OPENAI_API_KEY"
     value = "donkey"
     service.initialize_user_variables(user_id, session=session)
-    result = service.create_variable(user_id, "OPENAI_API_KEY", "donkey", session=session)
+    result = service.create_variable(
+        user_id, "OPENAI_API_KEY", "donkey", default_fields=[], _type=GENERIC_TYPE, session=session
+    )
     new_service = DatabaseVariableService(get_settings_service())
     new_service.initialize_user_variables(user_id, session=session)
 
@@ -45,12 +48,44 @@ def test_initialize_user_variables__donkey(service, session):
     assert result != value
 
 
-def test_initialize_user_variables__not_found_variable(service, session):
-    with patch("langflow.services.variable.service.DatabaseVariableService.create_variable") as m:
+def test_initialize_user_variables__not_found_variable(service, session, monkeypatch):
+    user_id = uuid4()
+    monkeypatch.setattr(service.settings_service.settings, "store_environment_variables", True)
+    monkeypatch.setattr(service.settings_service.settings, "variables_to_get_from_environment", ["VAR1"])
+    monkeypatch.setenv("VAR1", "value1")
+    with patch("langflow.services.variable.service.DatabaseVariableService._build_variable") as m:
         m.side_effect = Exception()
-        service.initialize_user_variables(uuid4(), session=session)
+        service.initialize_user_variables(user_id, session=session)
 
-    assert True
+    m.assert_called_once()
+    assert service.list_variables(user_id, session=session) == []
+
+
+def test_initialize_user_variables__commit_error(service, session, monkeypatch):
+    user_id = uuid4()
+    monkeypatch.setattr(service.settings_service.settings, "store_environment_variables", True)
+    monkeypatch.setattr(service.settings_service.settings, "variables_to_get_from_environment", ["VAR1"])
+    monkeypatch.setenv("VAR1", "value1")
+    with patch.object(session, "commit", side_effect=Exception()):
+        service.initialize_user_variables(user_id, session=session)
+
+    assert service.list_variables(user_id, session=session) == []
+
+
+def test_initialize_user_variables__create_and_update(service, session, monkeypatch):
+    user_id = uuid4()
+    monkeypatch.setattr(service.settings_service.settings, "store_environment_variables", True)
+    monkeypatch.setattr(service.settings_service.settings, "variables_to_get_from_environment", ["VAR1", "VAR2"])
+    monkeypatch.setenv("VAR1", " value1 ")
+    monkeypatch.setenv("VAR2", "value2")
+    service.initialize_user_variables(user_id, session=session)
+    assert service.get_variable(user_id, "VAR1", "", session=session) == "value1"
+    monkeypatch.setenv("VAR1", "new_value1")
+    service.initialize_user_variables(user_id, session=session)
+
+    assert sorted(service.list_variables(user_id, session=session)) == ["VAR1", "VAR2"]
+    assert service.get_variable(user_id, "VAR1", "", session=session) == "new_value1"
+    assert service.get_variable(user_id, "VAR2", "", session=session) == "value2"
 
 
 def test_initialize_user_variables__skipping_environment_variable_storage(service, session):
@@ -64,7 +99,7 @@ def test_get_variable(service, session):
     name = "name"
     value = "value"
     field = ""
-    service.create_variable(user_id, name, value, session=session)
+    service.create_variable(user_id, name, value, default_fields=[], _type=GENERIC_TYPE, session=session)
 
     result = service.get_variable(user_id, name, field, session=session)
 
@@ -89,7 +124,7 @@ def test_get_variable__TypeError(service, session):
     value = "value"
     field = "session_id"
     _type = CREDENTIAL_TYPE
-    service.create_variable(user_id, name, value, _type=_type, session=session)
+    service.create_variable(user_id, name, value, default_fields=[], _type=_type, session=session)
 
     with pytest.raises(TypeError) as exc:
         service.get_variable(user_id, name, field, session)
@@ -98,12 +133,24 @@ def test_get_variable__TypeError(service, session):
     assert "purpose is to prevent the exposure of value" in str(exc.value)
 
 
+def test_get_variables(service, session):
+    user_id = uuid4()
+    service.create_variable(user_id, "name1", "value1", default_fields=[], _type=GENERIC_TYPE, session=session)
+    service.create_variable(user_id, "name2", "value2", default_fields=[], _type=GENERIC_TYPE, session=session)
+    service.create_variable(uuid4(), "name1", "other", default_fields=[], _type=GENERIC_TYPE, session=session)
+
+    result = service.get_variables(user_id, ["name1", "name2", "missing"], session=session)
+
+    assert set(result) == {"name1", "name2"}
+    assert all(variable.user_id == user_id for variable in result.values())
+
+
 def test_list_variables(service, session):
     user_id = uuid4()
     names = ["name1", "name2", "name3"]
     value = "value"
     for name in names:
-        service.create_variable(user_id, name, value, session=session)
+        service.create_variable(user_id, name, value, default_fields=[], _type=GENERIC_TYPE, session=session)
 
     result = service.list_variables(user_id, session=session)
 
@@ -123,7 +170,7 @@ def test_update_variable(service, session):
     old_value = "old_value"
     new_value = "new_value"
     field = ""
-    service.create_variable(user_id, name, old_value, session=session)
+    service.create_variable(user_id, name, old_value, default_fields=[], _type=GENERIC_TYPE, session=session)
 
     old_recovered = service.get_variable(user_id, name, field, session=session)
     result = service.update_variable(user_id, name, new_value, session=session)
@@ -155,7 +202,9 @@ def test_update_variable__ValueError(service, session):
 
 def test_update_variable_fields(service, session):
     user_id = uuid4()
-    variable = service.create_variable(user_id, "old_name", "old_value", session=session)
+    variable = service.create_variable(
+        user_id, "old_name", "old_value", default_fields=[], _type=GENERIC_TYPE, session=session
+    )
     saved = variable.model_dump()
     variable = VariableUpdate(**saved)
     variable.name = "new_name"
@@ -173,19 +222,53 @@ def test_update_variable_fields(service, session):
     assert saved.get("user_id") == result.user_id
     assert saved.get("name") != result.name
     assert saved.get("value") != result.value
+    assert service.get_variable(user_id, "new_name", "", session=session) == "new_value"
     assert saved.get("default_fields") != result.default_fields
     assert saved.get("type") == result.type
     assert saved.get("created_at") == result.created_at
     assert saved.get("updated_at") != result.updated_at
 
 
+def test_update_variable_fields__keeps_value_when_not_set(service, session):
+    user_id = uuid4()
+    variable = service.create_variable(
+        user_id, "old_name", "old_value", default_fields=[], _type=GENERIC_TYPE, session=session
+    )
+    saved = variable.model_dump()
+
+    result = service.update_variable_fields(
+        user_id=user_id,
+        variable_id=saved.get("id"),
+        variable=VariableUpdate(id=saved.get("id"), name="new_name"),
+        session=session,
+    )
+
+    assert result.name == "new_name"
+    assert result.value == saved.get("value")
+    assert service.get_variable(user_id, "new_name", "", session=session) == "old_value"
+
+
+def test_update_variable_fields__other_user(service, session):
+    variable = service.create_variable(uuid4(), "name", "value", default_fields=[], _type=GENERIC_TYPE, session=session)
+
+    with pytest.raises(NoResultFound) as exc:
+        service.update_variable_fields(
+            user_id=uuid4(),
+            variable_id=variable.id,
+            variable=VariableUpdate(id=variable.id, name="new_name"),
+            session=session,
+        )
+
+    assert str(variable.id) in str(exc.value)
+
+
 def test_delete_variable(service, session):
     user_id = uuid4()
     name = "name"
     value = "value"
     field = ""
 
-    service.create_variable(user_id, name, value, session=session)
+    service.create_variable(user_id, name, value, default_fields=[], _type=GENERIC_TYPE, session=session)
     recovered = service.get_variable(user_id, name, field, session=session)
     service.delete_variable(user_id, name, session=session)
     with pytest.raises(ValueError) as exc:
@@ -213,7 +296,7 @@ def test_delete_varaible_by_id(service, session):
     value = "value"
     field = "field"
 
-    saved = service.create_variable(user_id, name, value, session=session)
+    saved = service.create_variable(user_id, name, value, default_fields=[], _type=GENERIC_TYPE, session=session)
     recovered = service.get_variable(user_id, name, field, session=session)
     service.delete_variable_by_id(user_id, saved.id, session=session)
     with pytest.raises(ValueError) as exc:
@@ -240,7 +323,7 @@ def test_create_variable(service, session):
     name = "name"
     value = "value"
 
-    result = service.create_variable(user_id, name, value, session=session)
+    result = service.create_variable(user_id, name, value, default_fields=[], _type=GENERIC_TYPE, session=session)
 
     assert result.user_id == user_id
     assert result.name == name
@@ -11,7 +11,7 @@ from langflow.api.v1.schemas import FlowListCreate, ResultDataResponse
 from langflow.graph.utils import log_transaction, log_vertex_build
 from langflow.initial_setup.setup import load_flows_from_directory, load_starter_projects
 from langflow.services.database.models.base import orjson_dumps
-from langflow.services.database.models.flow import Flow, FlowCreate, FlowUpdate
+from langflow.services.database.models.flow import Flow, FlowCreate, FlowRead, FlowUpdate
 from langflow.services.database.models.folder.model import FolderCreate
 from langflow.services.database.utils import session_getter
 from langflow.services.deps import get_db_service
@@ -67,6 +67,25 @@ def test_read_flows(client: TestClient, json_flow: str, active_user, logged_in_h
     assert len(response.json()) > 0
 
 
+def test_read_flow_headers(client: TestClient, json_flow: str, active_user, logged_in_headers):
+    flow_data = orjson.loads(json_flow)
+    flow = FlowCreate(name=str(uuid4()), description="description", data=flow_data["data"])
+    response = client.post("api/v1/flows/", json=flow.model_dump(), headers=logged_in_headers)
+    assert response.status_code == 201
+
+    response = client.get("api/v1/flows/headers", headers=logged_in_headers)
+    assert response.status_code == 200
+    headers = {header["name"]: header for header in response.json()}
+    assert flow.name in headers
+    assert headers[flow.name]["description"] == "description"
+    assert "data" not in headers[flow.name]
+
+    for params in ({}, {"remove_example_flows": True}):
+        flows = client.get("api/v1/flows/", params=params, headers=logged_in_headers).json()
+        headers = client.get("api/v1/flows/headers", params=params, headers=logged_in_headers).json()
+        assert {header["id"] for header in headers} == {flow["id"] for flow in flows}
+
+
 def test_read_flows_components_only(client: TestClient, flow_component: dict, logged_in_headers):
     response = client.get("api/v1/flows/", headers=logged_in_headers, params={"components_only": True})
     assert response.status_code == 200
@@ -325,6 +344,23 @@ def test_upload_file(client: TestClient, session: Session, json_flow: str, logge
     assert response_data[1]["data"] == data
 
 
+@pytest.mark.parametrize("as_list", [True, False])
+def test_upload_file_with_legacy_icon(client: TestClient, json_flow: str, logged_in_headers, as_list):
+    data = orjson.loads(json_flow)["data"]
+    flow_name = str(uuid4())
+    flow = {"name": flow_name, "icon": "Bot", "data": data}
+    file_contents = orjson_dumps({"flows": [flow]} if as_list else flow)
+    response = client.post(
+        "api/v1/flows/upload/",
+        files={"file": ("examples.json", file_contents, "application/json")},
+        headers=logged_in_headers,
+    )
+    assert response.status_code == 201
+    response_data = response.json()
+    assert response_data[0]["name"] == flow_name
+    assert response_data[0]["icon"] == "Bot"
+
+
 def test_download_file(
     client: TestClient,
     session: Session,
@@ -374,6 +410,59 @@ def test_create_flow_with_invalid_data(client: TestClient, active_user, logged_i
     assert response.status_code == 422
 
 
+@pytest.mark.parametrize(
+    ("icon", "expected"),
+    [
+        (None, None),
+        ("cpu", "cpu"),
+        ("message-square", "message-square"),
+        ("bar-chart-2", "bar-chart-2"),
+        ("Bot", "Bot"),
+        ("CrewAI", "CrewAI"),
+        ("custom_components", "custom_components"),
+        ("🤖", "🤖"),
+        (":robot:", "🤖"),
+    ],
+)
+def test_flow_icon_validation(icon, expected):
+    assert FlowCreate(name="flow", icon=icon).icon == expected
+
+
+@pytest.mark.parametrize("icon", ["-", "---", "2d", "_bot", ":robot", "robot:", ":not_an_emoji:", "🤖 bot"])
+def test_flow_icon_validation__invalid(icon):
+    with pytest.raises(ValueError):
+        FlowCreate(name="flow", icon=icon)
+
+
+@pytest.mark.parametrize("icon", ["Bot", "bar-chart-2"])
+def test_flow_icon_validation__legacy_icon_on_read(icon):
+    flow = Flow(name="flow", icon=icon)
+    assert FlowRead.model_validate(flow, from_attributes=True).icon == icon
+
+
+@pytest.mark.parametrize("color", ["#fff", "#12345g", "1234567", "#1234567"])
+def test_flow_icon_bg_color_validation__invalid(color):
+    with pytest.raises(ValueError):
+        FlowCreate(name="flow", icon_bg_color=color)
+
+
+def test_flow_icon_bg_color_validation__legacy_value_on_read():
+    flow = Flow(name="flow", icon_bg_color="#zzzzzz")
+    assert FlowRead.model_validate(flow, from_attributes=True).icon_bg_color == "#zzzzzz"
+
+
+def test_read_flows_with_legacy_icon_bg_color(client: TestClient, active_user, logged_in_headers):
+    flow_name = str(uuid4())
+    with session_getter(get_db_service()) as session:
+        session.add(Flow(name=flow_name, icon_bg_color="#zzzzzz", user_id=active_user.id))
+        session.commit()
+
+    response = client.get("api/v1/flows/", headers=logged_in_headers)
+    assert response.status_code == 200
+    flows = {flow["name"]: flow for flow in response.json()}
+    assert flows[flow_name]["icon_bg_color"] == "#zzzzzz"
+
+
 def test_get_nonexistent_flow(client: TestClient, active_user, logged_in_headers):
     uuid = uuid4()
     response = client.get(f"api/v1/flows/{uuid}", headers=logged_in_headers)